@@ -8,6 +8,8 @@ from pathlib import Path
 import logging
 from datetime import datetime, timedelta
 import time
+from functools import lru_cache
+import unicodedata
 from unidecode import unidecode
 import json
 
@@ -20,6 +22,19 @@ BASE_DIR = Path(__file__).resolve().parents[1]
 PROCESSED_DIR = BASE_DIR / "data" / "processed"
 PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
+@lru_cache(maxsize=4096)
+def _clean_name(name: str) -> str:
+    """Normalize a player name into a stable matching key
+
+    Must stay in sync with enhanced_pitcher_collector._clean_name — the
+    name_key column emitted here is merged against keys built there.
+    """
+    decomposed = unicodedata.normalize('NFKD', str(name))
+    cleaned = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    if not cleaned.isascii():
+        cleaned = unidecode(cleaned)
+    return cleaned.strip().casefold()
+
 class BaseballSavantCollector:
     def __init__(self):
         self.session = requests.Session()
@@ -167,32 +182,36 @@ class BaseballSavantCollector:
         Match Baseball Savant data to Fangraphs pitcher names
         """
         matched_data = []
-        
+
+        # Clean the Savant side once; every candidate is compared repeatedly
+        savant_keys = savant_df['Name'].map(_clean_name)
+
         for fg_name in fangraphs_names:
-            fg_name_clean = unidecode(fg_name.strip().lower())
-            
+            fg_name_clean = _clean_name(fg_name)
+
             # Try exact match first
-            exact_match = savant_df[savant_df['Name'].str.lower() == fg_name_clean]
+            exact_match = savant_df[savant_keys == fg_name_clean]
             if not exact_match.empty:
                 match_row = exact_match.iloc[0].copy()
                 match_row['matched_name'] = fg_name
+                match_row['name_key'] = fg_name_clean
                 matched_data.append(match_row)
                 continue
-            
+
             # Try fuzzy matching
             from difflib import SequenceMatcher
             best_match = None
             best_score = 0.8  # High threshold for name matching
-            
+
             for idx, row in savant_df.iterrows():
-                savant_name_clean = unidecode(row['Name'].strip().lower())
-                similarity = SequenceMatcher(None, fg_name_clean, savant_name_clean).ratio()
-                
+                similarity = SequenceMatcher(None, fg_name_clean, savant_keys.loc[idx]).ratio()
+
                 if similarity > best_score:
                     best_score = similarity
                     best_match = row.copy()
                     best_match['matched_name'] = fg_name
-            
+                    best_match['name_key'] = fg_name_clean
+
             if best_match is not None:
                 matched_data.append(best_match)
                 logger.info(f"Fuzzy matched '{fg_name}' to '{best_match['Name']}' (score: {best_score:.2f})")
@@ -201,9 +220,10 @@ class BaseballSavantCollector:
                 placeholder = pd.Series({
                     'Name': fg_name,
                     'xwOBA': np.nan,
-                    'xBA': np.nan, 
+                    'xBA': np.nan,
                     'xSLG': np.nan,
-                    'matched_name': fg_name
+                    'matched_name': fg_name,
+                    'name_key': fg_name_clean
                 })
                 matched_data.append(placeholder)
                 logger.warning(f"No match found for pitcher: {fg_name}")
@@ -1,12 +1,9 @@
 # enhanced_hitter_collector.py
 
-import pandas as pd
-from pybaseball import batting_stats
 from pathlib import Path
 import logging
 from datetime import datetime
 import argparse
-import numpy as np
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -32,6 +29,11 @@ def collect_enhanced_hitter_data(season=2025, min_pa=300):
     - Barrel % (Barrel Percentage)
     - K:BB ratio (Strikeout to Walk Ratio)
     """
+    # Lazy import: pybaseball pulls in pandas/requests and is slow to load,
+    # so keep it off the CLI startup path (argparse/--help stays stdlib-only)
+    import pandas as pd
+    from pybaseball import batting_stats
+
     try:
         logger.info(f"Collecting enhanced hitter data for {season} season...")
         logger.info(f"Minimum plate appearances: {min_pa}")
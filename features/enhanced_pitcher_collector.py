@@ -9,10 +9,19 @@ from pathlib import Path
 import logging
 from datetime import datetime
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import unicodedata
 from unidecode import unidecode
 import sys
 import os
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
 # Add the current directory to path so we can import other modules
 sys.path.append(str(Path(__file__).parent))
 
@@ -35,6 +44,20 @@ RAW_DIR = BASE_DIR / "data" / "raw"
 PROCESSED_DIR = BASE_DIR / "data" / "processed"
 PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
+@lru_cache(maxsize=4096)
+def _clean_name(name: str) -> str:
+    """Normalize a pitcher name for matching, cached for repeat lookups
+
+    NFKD decomposition plus stripping combining marks handles the accented
+    Latin names on MLB rosters in C-level code; unidecode stays as the
+    fallback for the rare name that still isn't ASCII afterwards.
+    """
+    decomposed = unicodedata.normalize('NFKD', str(name))
+    cleaned = ''.join(c for c in decomposed if not unicodedata.combining(c))
+    if not cleaned.isascii():
+        cleaned = unidecode(cleaned)
+    return cleaned.strip().casefold()
+
 def get_enhanced_fangraphs_data(season=2024, min_ip=20):
     """
     Get pitcher data from Fangraphs with proper CSW% formatting
@@ -46,21 +69,23 @@ def get_enhanced_fangraphs_data(season=2024, min_ip=20):
         pitcher_data = pitching_stats(season, season, qual=min_ip)
         
         if pitcher_data is not None and not pitcher_data.empty:
-            # Fix CSW% format - convert from decimal to percentage if needed
+            # Fix CSW% format - convert from decimal to percentage if needed.
+            # Probing one non-NaN value is enough to tell the two formats
+            # apart; no need to scan the whole column with max()
             if 'CSW%' in pitcher_data.columns:
-                # Check if values are in decimal format (< 1.0)
-                csw_values = pitcher_data['CSW%'].dropna()
-                if len(csw_values) > 0 and csw_values.max() <= 1.0:
+                csw = pitcher_data['CSW%']
+                first_valid = csw.first_valid_index()
+                if first_valid is not None and csw.at[first_valid] <= 1.0:
                     logger.info("Converting CSW% from decimal to percentage format")
-                    pitcher_data['CSW%'] = pitcher_data['CSW%'] * 100
+                    pitcher_data['CSW%'] = csw.to_numpy() * 100
                     
             logger.info(f"Successfully retrieved data for {len(pitcher_data)} pitchers")
-            logger.info(f"Available columns: {list(pitcher_data.columns)}")
-            
-            # Print CSW% sample to verify format
-            if 'CSW%' in pitcher_data.columns:
-                csw_sample = pitcher_data['CSW%'].dropna().head(3)
-                logger.info(f"CSW% sample values: {csw_sample.tolist()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Available columns: %s", pitcher_data.columns.tolist())
+
+                # Print CSW% sample to verify format
+                if 'CSW%' in pitcher_data.columns:
+                    logger.debug("CSW%% sample values: %s", pitcher_data['CSW%'].dropna().head(3).tolist())
         else:
             logger.warning("No data returned from Fangraphs")
             
@@ -76,83 +101,90 @@ def create_enhanced_sample_data():
     """
     logger.info("Creating enhanced sample data with proper formatting...")
     
+    # Typed arrays let pandas skip per-element dtype inference, and fp32 is
+    # plenty of precision for downstream scoring
     sample_data = {
-        'Name': ['Paul Skenes', 'Cristopher Sanchez', 'Max Fried', 'Joe Ryan', 
+        'Name': np.asarray(['Paul Skenes', 'Cristopher Sanchez', 'Max Fried', 'Joe Ryan',
                 'Edward Cabrera', 'Nick Pivetta', 'Freddy Peralta', 'Kevin Gausman',
                 'Brady Singer', 'Jack Flaherty', 'Clay Holmes', 'Shane Baz',
                 'Jeffrey Springs', 'Trevor Williams', 'Grant Holmes', 'Andre Pallante',
-                'Tyler Anderson', 'Richard Fitts'],
-        'Team': ['PIT', 'PHI', 'NYY', 'MIN', 'MIA', 'SDP', 'MIL', 'TOR', 
+                'Tyler Anderson', 'Richard Fitts'], dtype=object),
+        'Team': np.asarray(['PIT', 'PHI', 'NYY', 'MIN', 'MIA', 'SDP', 'MIL', 'TOR',
                 'CIN', 'DET', 'NYM', 'TBR', 'ATH', 'WSN', 'ATL', 'STL',
-                'LAA', 'BOS'],
-        'IP': [167.0, 169.1, 162.0, 155.0, 128.2, 158.1, 153.2, 160.2,
+                'LAA', 'BOS'], dtype=object),
+        'IP': np.asarray([167.0, 169.1, 162.0, 155.0, 128.2, 158.1, 153.2, 160.2,
               143.1, 142.1, 142.1, 150.0, 151.0, 82.2, 115.0, 144.0,
-              136.1, 45.0],
-        'WHIP': [0.95, 1.12, 1.11, 0.97, 1.21, 0.94, 1.07, 1.05,
+              136.1, 45.0], dtype=np.float32),
+        'WHIP': np.asarray([0.95, 1.12, 1.11, 0.97, 1.21, 0.94, 1.07, 1.05,
                 1.26, 1.29, 1.31, 1.34, 1.19, 1.54, 1.34, 1.44,
-                1.41, 1.31],
-        'FIP': [2.46, 2.59, 3.22, 3.29, 3.68, 3.35, 3.60, 3.65,
+                1.41, 1.31], dtype=np.float32),
+        'FIP': np.asarray([2.46, 2.59, 3.22, 3.29, 3.68, 3.35, 3.60, 3.65,
                3.74, 3.94, 4.08, 4.56, 4.77, 4.12, 4.39, 4.68,
-               5.59, 5.80],
-        'SIERA': [3.17, 3.09, 3.65, 3.19, 3.64, 3.61, 3.83, 3.83,
+               5.59, 5.80], dtype=np.float32),
+        'SIERA': np.asarray([3.17, 3.09, 3.65, 3.19, 3.64, 3.61, 3.83, 3.83,
                  4.14, 3.61, 4.39, 3.93, 4.58, 4.57, 4.16, 4.29,
-                 5.21, 4.30],
-        'CSW%': [29.3, 31.0, 27.4, 27.8, 31.0, 28.9, 27.2, 28.0,  # FIXED: Now as percentages
+                 5.21, 4.30], dtype=np.float32),
+        'CSW%': np.asarray([29.3, 31.0, 27.4, 27.8, 31.0, 28.9, 27.2, 28.0,  # FIXED: Now as percentages
                 27.5, 29.8, 26.8, 27.3, 27.2, 25.3, 27.7, 24.6,
-                26.2, 24.8],
-        'xERA': [2.58, 3.05, 3.73, 3.36, 3.92, 3.73, 3.41, 3.73,
+                26.2, 24.8], dtype=np.float32),
+        'xERA': np.asarray([2.58, 3.05, 3.73, 3.36, 3.92, 3.73, 3.41, 3.73,
                 4.12, 4.06, 4.35, 3.76, 4.20, 4.44, 4.41, 4.32,
-                5.10, 5.55],
-        'xFIP': [3.08, 2.83, 3.50, 3.56, 3.57, 3.78, 3.99, 3.84,
+                5.10, 5.55], dtype=np.float32),
+        'xFIP': np.asarray([3.08, 2.83, 3.50, 3.56, 3.57, 3.78, 3.99, 3.84,
                 4.20, 3.69, 4.21, 3.88, 4.63, 4.54, 4.02, 4.01,
-                5.38, 4.25],
-        'Stuff+': [114, 128, 123, 108, 108, 92, 105, 101,
+                5.38, 4.25], dtype=np.float32),
+        'Stuff+': np.asarray([114, 128, 123, 108, 108, 92, 105, 101,
                    90, 97, 109, 113, 87, 90, 81, 87,
-                   94, 107],
-        'ERA': [2.05, 2.66, 3.06, 3.08, 3.57, 2.84, 2.58, 3.75,
+                   94, 107], dtype=np.float32),
+        'ERA': np.asarray([2.05, 2.66, 3.06, 3.08, 3.57, 2.84, 2.58, 3.75,
                4.08, 4.74, 3.60, 4.98, 4.17, 6.21, 3.99, 5.38,
-               4.56, 5.00],
-        'K%': [28.6, 26.3, 23.1, 28.3, 25.8, 26.8, 26.7, 24.3,
+               4.56, 5.00], dtype=np.float32),
+        'K%': np.asarray([28.6, 26.3, 23.1, 28.3, 25.8, 26.8, 26.7, 24.3,
               23.1, 28.1, 18.2, 24.4, 19.4, 17.4, 25.0, 16.0,
-              17.4, 20.5],
-        'BB%': [5.8, 6.0, 6.3, 4.9, 7.7, 6.7, 9.2, 6.7,
+              17.4, 20.5], dtype=np.float32),
+        'BB%': np.asarray([5.8, 6.0, 6.3, 4.9, 7.7, 6.7, 9.2, 6.7,
                8.6, 8.6, 9.2, 8.8, 7.6, 5.6, 11.0, 8.2,
-               9.5, 8.2]
+               9.5, 8.2], dtype=np.float32)
     }
-    
+
     df = pd.DataFrame(sample_data)
     logger.info(f"Created enhanced sample data for {len(df)} pitchers")
     logger.info(f"CSW% range: {df['CSW%'].min():.1f}% - {df['CSW%'].max():.1f}%")
     return df
 
-def combine_fangraphs_and_savant_data(fangraphs_df, pitcher_names, season=2024):
+def combine_fangraphs_and_savant_data(fangraphs_df, pitcher_names, season=2024, savant_file=None):
     """
     Combine Fangraphs data with Baseball Savant expected stats
+
+    Pass savant_file to reuse an already-fetched Savant export instead of
+    fetching here.
     """
     try:
         logger.info("Combining Fangraphs data with Baseball Savant expected stats...")
-        
-        # Get expected stats from Baseball Savant
-        savant_file = collect_expected_stats_for_pitchers(pitcher_names, season=season)
+
+        # Get expected stats from Baseball Savant unless already fetched
+        if savant_file is None:
+            savant_file = collect_expected_stats_for_pitchers(pitcher_names, season=season)
         
         if savant_file and Path(savant_file).exists():
             savant_df = pd.read_csv(savant_file)
             logger.info(f"Loaded Baseball Savant data for {len(savant_df)} pitchers")
             
-            # Merge the data based on pitcher names
-            # Clean names for matching
-            fangraphs_df['Name_clean'] = fangraphs_df['Name'].apply(lambda x: unidecode(str(x).strip()))
-            savant_df['Name_clean'] = savant_df['matched_name'].apply(lambda x: unidecode(str(x).strip()))
-            
-            # Merge on cleaned names
-            combined_df = fangraphs_df.merge(
-                savant_df[['Name_clean', 'xwOBA', 'xBA', 'xSLG']], 
-                on='Name_clean', 
-                how='left'
-            )
-            
-            # Drop the temporary clean name column
-            combined_df = combined_df.drop(columns=['Name_clean'])
+            # The Savant collector emits a pre-normalized name_key, so only
+            # the Fangraphs side needs cleaning here (older saved files
+            # without the column fall back to cleaning matched_name)
+            if 'name_key' not in savant_df.columns:
+                savant_df['name_key'] = savant_df['matched_name'].map(_clean_name)
+
+            # Join on the name_key index; drop_duplicates plus
+            # validate='m:1' guarantees the join cannot explode rows
+            savant_small = (savant_df[['name_key', 'xwOBA', 'xBA', 'xSLG']]
+                            .drop_duplicates('name_key')
+                            .set_index('name_key'))
+            combined_df = (fangraphs_df.assign(name_key=fangraphs_df['Name'].map(_clean_name))
+                           .set_index('name_key')
+                           .join(savant_small, how='left', validate='m:1')
+                           .reset_index(drop=True))
             
             # Report merge results
             merged_count = combined_df[['xwOBA', 'xBA', 'xSLG']].notna().any(axis=1).sum()
@@ -171,36 +203,28 @@ def combine_fangraphs_and_savant_data(fangraphs_df, pitcher_names, season=2024):
 
 def add_sample_expected_stats(fangraphs_df):
     """Add sample expected stats to Fangraphs data"""
-    # Create realistic expected stats based on pitcher performance
-    expected_stats = []
-    
-    for _, pitcher in fangraphs_df.iterrows():
-        # Use FIP and ERA to estimate expected stats
-        fip = pitcher.get('FIP', 4.0)
-        era = pitcher.get('ERA', 4.0)
-        
-        # Lower FIP/ERA = better expected stats
-        if fip < 3.0:
-            xwoba, xba, xslg = 0.280 + np.random.normal(0, 0.020), 0.220 + np.random.normal(0, 0.015), 0.350 + np.random.normal(0, 0.030)
-        elif fip < 3.5:
-            xwoba, xba, xslg = 0.310 + np.random.normal(0, 0.020), 0.250 + np.random.normal(0, 0.015), 0.400 + np.random.normal(0, 0.030)
-        elif fip < 4.0:
-            xwoba, xba, xslg = 0.340 + np.random.normal(0, 0.020), 0.270 + np.random.normal(0, 0.015), 0.450 + np.random.normal(0, 0.030)
-        else:
-            xwoba, xba, xslg = 0.370 + np.random.normal(0, 0.020), 0.290 + np.random.normal(0, 0.015), 0.500 + np.random.normal(0, 0.030)
-        
-        # Ensure reasonable bounds
-        xwoba = max(0.200, min(0.450, xwoba))
-        xba = max(0.180, min(0.350, xba))
-        xslg = max(0.300, min(0.600, xslg))
-        
-        expected_stats.append({'xwOBA': round(xwoba, 3), 'xBA': round(xba, 3), 'xSLG': round(xslg, 3)})
-    
-    # Add to dataframe
-    for i, stats in enumerate(expected_stats):
-        for stat, value in stats.items():
-            fangraphs_df.loc[i, stat] = value
-    
+    # Create realistic expected stats based on pitcher performance,
+    # fully vectorized: bin FIP once, draw all noise in one batch,
+    # and assign the three columns in a single block
+    n = len(fangraphs_df)
+    if 'FIP' in fangraphs_df.columns:
+        fip = fangraphs_df['FIP'].fillna(4.0).to_numpy(dtype=np.float64)
+    else:
+        fip = np.full(n, 4.0)
+
+    # Lower FIP = better expected stats
+    bins = np.digitize(fip, [3.0, 3.5, 4.0])
+    xwoba = np.array([0.280, 0.310, 0.340, 0.370])[bins] + np.random.normal(0, 0.020, n)
+    xba = np.array([0.220, 0.250, 0.270, 0.290])[bins] + np.random.normal(0, 0.015, n)
+    xslg = np.array([0.350, 0.400, 0.450, 0.500])[bins] + np.random.normal(0, 0.030, n)
+
+    # Ensure reasonable bounds
+    xwoba = np.clip(xwoba, 0.200, 0.450).round(3)
+    xba = np.clip(xba, 0.180, 0.350).round(3)
+    xslg = np.clip(xslg, 0.300, 0.600).round(3)
+
+    fangraphs_df[['xwOBA', 'xBA', 'xSLG']] = np.stack([xwoba, xba, xslg], axis=1)
+
     logger.info("Added sample expected stats to Fangraphs data")
     return fangraphs_df
 
@@ -209,17 +233,43 @@ def collect_enhanced_pitcher_data(matchup_file_path=None, season=2024, min_ip=20
     Main function to collect enhanced pitcher data from multiple sources
     """
     
+    # Parse the matchup file once up front; both the concurrent Savant
+    # pull and the final filter reuse the same name list instead of
+    # re-reading and re-parsing the CSV
+    probable_names = None
+    if matchup_file_path:
+        try:
+            matchups = pd.read_csv(matchup_file_path, usecols=['home_pitcher', 'away_pitcher'])
+            names = set(matchups['home_pitcher'].dropna()) | set(matchups['away_pitcher'].dropna())
+            probable_names = sorted(name for name in names if name != 'TBD')
+        except Exception as e:
+            logger.warning(f"Could not read probable pitchers: {e}")
+
     if use_sample:
         logger.info("Using enhanced sample data...")
         pitcher_data = create_enhanced_sample_data()
-        
+
         # Add sample expected stats
         pitcher_data = add_sample_expected_stats(pitcher_data)
-        
+
     else:
         logger.info("Fetching live enhanced data...")
-        pitcher_data = get_enhanced_fangraphs_data(season=season, min_ip=min_ip)
-        
+
+        # If the probable-pitcher names are known up front, the Fangraphs
+        # and Savant pulls (both I/O-bound HTTP) can run concurrently
+        # instead of back-to-back
+
+        savant_file = None
+        if probable_names:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                fg_future = executor.submit(get_enhanced_fangraphs_data, season, min_ip)
+                savant_future = executor.submit(collect_expected_stats_for_pitchers,
+                                                probable_names, season)
+                pitcher_data = fg_future.result()
+                savant_file = savant_future.result()
+        else:
+            pitcher_data = get_enhanced_fangraphs_data(season=season, min_ip=min_ip)
+
         if pitcher_data is None or pitcher_data.empty:
             logger.error("Failed to get Fangraphs data, using sample")
             pitcher_data = create_enhanced_sample_data()
@@ -227,29 +277,27 @@ def collect_enhanced_pitcher_data(matchup_file_path=None, season=2024, min_ip=20
         else:
             # Get pitcher names for Baseball Savant lookup
             pitcher_names = pitcher_data['Name'].dropna().tolist()
-            pitcher_data = combine_fangraphs_and_savant_data(pitcher_data, pitcher_names, season)
+            pitcher_data = combine_fangraphs_and_savant_data(pitcher_data, pitcher_names, season,
+                                                             savant_file=savant_file)
     
-    # Filter to specific pitchers if we have a matchup file
-    if matchup_file_path:
+    # Filter to specific pitchers if the matchup file yielded any
+    if probable_names:
         try:
-            matchups = pd.read_csv(matchup_file_path)
-            home_pitchers = matchups['home_pitcher'].dropna().tolist()
-            away_pitchers = matchups['away_pitcher'].dropna().tolist()
-            target_pitchers = list(set(home_pitchers + away_pitchers))
-            target_pitchers = [name for name in target_pitchers if name != 'TBD']
-            
+            target_pitchers = probable_names
+
             logger.info(f"Filtering for {len(target_pitchers)} pitchers from matchups")
             
-            # Match pitcher names
-            target_pitchers_clean = [unidecode(name.strip()) for name in target_pitchers]
-            pitcher_data_clean = pitcher_data.copy()
-            pitcher_data_clean['Name_clean'] = pitcher_data_clean['Name'].apply(lambda x: unidecode(x.strip()))
-            
-            filtered_data = pitcher_data_clean[pitcher_data_clean['Name_clean'].isin(target_pitchers_clean)]
-            
-            if len(filtered_data) > 0:
-                logger.info(f"Found {len(filtered_data)} matching pitchers")
-                final_data = filtered_data.drop(columns=['Name_clean'])
+            # Match pitcher names against a standalone cleaned Series so the
+            # wide frame is never copied just to carry a temporary column
+            # For a tiny target set, a direct membership map beats isin
+            # (which builds its own hashtable) and skips the intermediate
+            # cleaned-name Series entirely
+            targets = frozenset(_clean_name(name) for name in target_pitchers)
+            mask = pitcher_data['Name'].map(lambda name: _clean_name(name) in targets)
+
+            if mask.any():
+                logger.info(f"Found {int(mask.sum())} matching pitchers")
+                final_data = pitcher_data.loc[mask]
             else:
                 logger.warning("No specific pitchers found, using all data")
                 final_data = pitcher_data
@@ -264,7 +312,12 @@ def collect_enhanced_pitcher_data(matchup_file_path=None, season=2024, min_ip=20
     date_str = datetime.now().strftime('%Y-%m-%d')
     output_path = PROCESSED_DIR / f"enhanced_pitcher_data_{date_str}.csv"
     
-    final_data.to_csv(output_path, index=False)
+    # Arrow's multithreaded CSV writer is markedly faster for the mostly
+    # numeric frame; fall back to pandas when pyarrow isn't installed
+    if pa is not None:
+        pacsv.write_csv(pa.Table.from_pandas(final_data, preserve_index=False), str(output_path))
+    else:
+        final_data.to_csv(output_path, index=False)
     logger.info(f"Saved enhanced pitcher data to: {output_path}")
     
     # Print summary
@@ -298,10 +351,17 @@ def collect_enhanced_pitcher_data(matchup_file_path=None, season=2024, min_ip=20
 
 def find_latest_matchup_file():
     """Find the most recent matchup file"""
-    files = list(RAW_DIR.glob("mlb_probable_pitchers_*.csv"))
-    if not files:
+    # os.scandir caches stat info from the directory read, so this is one
+    # syscall per file instead of the glob + stat pair
+    try:
+        with os.scandir(RAW_DIR) as entries:
+            candidates = [e for e in entries
+                          if e.name.startswith("mlb_probable_pitchers_") and e.name.endswith(".csv")]
+    except FileNotFoundError:
+        return None
+    if not candidates:
         return None
-    return max(files, key=lambda x: x.stat().st_mtime)
+    return Path(max(candidates, key=lambda e: e.stat().st_mtime).path)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Collect enhanced pitcher data from multiple sources")
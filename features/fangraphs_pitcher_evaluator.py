@@ -6,6 +6,7 @@ from pathlib import Path
 import logging
 from datetime import datetime
 import argparse
+import os
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -16,6 +17,13 @@ BASE_DIR = Path(__file__).resolve().parents[1]
 PROCESSED_DIR = BASE_DIR / "data" / "processed"
 
 class FangraphsPitcherEvaluator:
+    # Grade/tier lookup tables for np.searchsorted (cutoffs ascending,
+    # labels one longer than cutoffs)
+    _GRADE_CUTS = np.array([40, 45, 50, 55, 60, 65, 70, 75, 80, 85, 90])
+    _GRADE_LABELS = np.array(['F', 'D', 'D+', 'C-', 'C', 'C+', 'B-', 'B', 'B+', 'A-', 'A', 'A+'])
+    _TIER_CUTS = np.array([45, 60, 75, 85])
+    _TIER_LABELS = np.array(['Poor', 'Below Average', 'Average', 'Above Average', 'Elite'])
+
     def __init__(self):
         # Weights for each metric (higher weight = more important)
         # Using your exact specified metrics
@@ -59,7 +67,22 @@ class FangraphsPitcherEvaluator:
             'xSLG': ['xSLG'],
             'Stuff+': ['Stuff+', 'Stuff']
         }
-    
+
+        # Precompiled benchmark table: one ascending threshold row per
+        # metric, with higher-is-better rows negated so a single
+        # searchsorted handles both scoring directions
+        self._metric_order = list(self.metric_weights)
+        self._metric_index = {m: i for i, m in enumerate(self._metric_order)}
+        self._higher_better = np.array([m in ('CSW%', 'Stuff+') for m in self._metric_order])
+        thresholds = np.array([[self.benchmarks[m]['excellent'], self.benchmarks[m]['good'],
+                                self.benchmarks[m]['average'], self.benchmarks[m]['poor']]
+                               for m in self._metric_order])
+        # fp32 is exact for these 2-3 decimal benchmarks and halves the
+        # bandwidth through the scoring ufuncs
+        self._thresholds = np.where(self._higher_better[:, None], -thresholds, thresholds).astype(np.float32)
+        self._score_table = np.array([95, 80, 60, 40, 20], dtype=np.float32)
+        self._weights = np.array([self.metric_weights[m] for m in self._metric_order], dtype=np.float32)
+
     def find_column(self, df, metric):
         """Find the correct column name in the DataFrame"""
         possible_names = self.column_mapping.get(metric, [metric])
@@ -67,59 +90,55 @@ class FangraphsPitcherEvaluator:
             if name in df.columns:
                 return name
         return None
+
+    def resolve_columns(self, df_columns):
+        """Resolve every metric to its actual column name in one pass"""
+        available = frozenset(df_columns)
+        resolved = {}
+        for metric in self.metric_weights:
+            possible_names = self.column_mapping.get(metric, [metric])
+            resolved[metric] = next((name for name in possible_names if name in available), None)
+        return resolved
     
     def calculate_percentile_score(self, value, metric):
         """Convert raw metric to 0-100 percentile score"""
         if pd.isna(value):
             return 50  # neutral score for missing data
-            
-        benchmarks = self.benchmarks[metric]
-        
-        # For metrics where lower is better (inverse scoring)
-        if metric in ['WHIP', 'FIP', 'SIERA', 'xERA', 'xFIP', 'xwOBA', 'xBA', 'xSLG']:
-            if value <= benchmarks['excellent']:
-                return 95
-            elif value <= benchmarks['good']:
-                return 80
-            elif value <= benchmarks['average']:
-                return 60
-            elif value <= benchmarks['poor']:
-                return 40
-            else:
-                return 20
-        
-        # For metrics where higher is better
-        else:  # CSW%, Stuff+
-            if value >= benchmarks['excellent']:
-                return 95
-            elif value >= benchmarks['good']:
-                return 80
-            elif value >= benchmarks['average']:
-                return 60
-            elif value >= benchmarks['poor']:
-                return 40
-            else:
-                return 20
+
+        j = self._metric_index[metric]
+        if self._higher_better[j]:
+            value = -value
+        return int(self._score_table[np.searchsorted(self._thresholds[j], value, side='left')])
     
     def calculate_composite_score(self, pitcher_row, df_columns):
         """Calculate weighted composite score for a pitcher"""
         total_score = 0
         total_weight = 0
         score_breakdown = {}
-        
+
+        resolved = self.resolve_columns(df_columns)
+
         for metric, weight in self.metric_weights.items():
-            col_name = self.find_column(pd.DataFrame(columns=df_columns), metric)
-            
-            if col_name and col_name in pitcher_row.index and not pd.isna(pitcher_row[col_name]):
-                percentile_score = self.calculate_percentile_score(pitcher_row[col_name], metric)
-                total_score += percentile_score * weight
-                total_weight += weight
-                score_breakdown[metric] = {
-                    'value': pitcher_row[col_name],
-                    'percentile_score': percentile_score,
-                    'weight': weight,
-                    'contribution': percentile_score * weight
-                }
+            col_name = resolved[metric]
+            if col_name is None or col_name not in pitcher_row.index:
+                continue
+
+            try:
+                value = float(pitcher_row[col_name])
+            except (TypeError, ValueError):
+                continue
+            if value != value:  # NaN check without pd.isna scalar dispatch
+                continue
+
+            percentile_score = self.calculate_percentile_score(value, metric)
+            total_score += percentile_score * weight
+            total_weight += weight
+            score_breakdown[metric] = {
+                'value': value,
+                'percentile_score': percentile_score,
+                'weight': weight,
+                'contribution': percentile_score * weight
+            }
         
         if total_weight == 0:
             return 50, score_breakdown  # neutral if no valid metrics
@@ -128,44 +147,14 @@ class FangraphsPitcherEvaluator:
         return round(composite_score, 1), score_breakdown
     
     def get_grade(self, score):
-        """Convert numerical score to letter grade"""
-        if score >= 90:
-            return 'A+'
-        elif score >= 85:
-            return 'A'
-        elif score >= 80:
-            return 'A-'
-        elif score >= 75:
-            return 'B+'
-        elif score >= 70:
-            return 'B'
-        elif score >= 65:
-            return 'B-'
-        elif score >= 60:
-            return 'C+'
-        elif score >= 55:
-            return 'C'
-        elif score >= 50:
-            return 'C-'
-        elif score >= 45:
-            return 'D+'
-        elif score >= 40:
-            return 'D'
-        else:
-            return 'F'
-    
+        """Convert numerical score(s) to letter grade(s)"""
+        grades = self._GRADE_LABELS[np.searchsorted(self._GRADE_CUTS, score, side='right')]
+        return grades.item() if np.ndim(score) == 0 else grades
+
     def get_tier(self, score):
-        """Categorize pitcher into performance tiers"""
-        if score >= 85:
-            return 'Elite'
-        elif score >= 75:
-            return 'Above Average'
-        elif score >= 60:
-            return 'Average'
-        elif score >= 45:
-            return 'Below Average'
-        else:
-            return 'Poor'
+        """Categorize pitcher score(s) into performance tiers"""
+        tiers = self._TIER_LABELS[np.searchsorted(self._TIER_CUTS, score, side='right')]
+        return tiers.item() if np.ndim(score) == 0 else tiers
     
     def analyze_strengths_weaknesses(self, score_breakdown):
         """Identify pitcher's strengths and weaknesses"""
@@ -183,69 +172,127 @@ class FangraphsPitcherEvaluator:
         
         return strengths, weaknesses
     
+    def score_metric_column(self, values, metric):
+        """Percentile-score a full metric column with np.searchsorted"""
+        j = self._metric_index[metric]
+        values = np.asarray(values, dtype=np.float32)
+        if self._higher_better[j]:
+            values = -values
+        scores = self._score_table[np.searchsorted(self._thresholds[j], values, side='left')]
+        return np.where(np.isnan(values), np.float32(50.0), scores)
+
     def evaluate_pitchers(self, fangraphs_df):
         """Evaluate all pitchers and return ranked results"""
-        results = []
-        
-        logger.info(f"Evaluating {len(fangraphs_df)} pitchers...")
-        
-        for idx, pitcher in fangraphs_df.iterrows():
-            composite_score, score_breakdown = self.calculate_composite_score(pitcher, fangraphs_df.columns)
-            grade = self.get_grade(composite_score)
-            tier = self.get_tier(composite_score)
-            strengths, weaknesses = self.analyze_strengths_weaknesses(score_breakdown)
-            
-            # Get key stats for display
-            key_stats = {}
-            for metric in self.metric_weights.keys():
-                col_name = self.find_column(fangraphs_df, metric)
-                if col_name and col_name in pitcher.index:
-                    key_stats[metric] = pitcher[col_name]
-                else:
-                    key_stats[metric] = 'N/A'
-            
-            result = {
-                'pitcher_name': pitcher['Name'] if 'Name' in pitcher.index else 'Unknown',
-                'team': pitcher['Team'] if 'Team' in pitcher.index else 'N/A',
-                'innings_pitched': pitcher['IP'] if 'IP' in pitcher.index else 'N/A',
-                'composite_score': composite_score,
-                'grade': grade,
-                'tier': tier,
-                'whip': key_stats['WHIP'],
-                'fip': key_stats['FIP'],
-                'siera': key_stats['SIERA'],
-                'csw_rate': key_stats['CSW%'],
-                'xera': key_stats['xERA'],
-                'xfip': key_stats['xFIP'],
-                'xwoba': key_stats['xwOBA'],
-                'xba': key_stats['xBA'],
-                'xslg': key_stats['xSLG'],
-                'stuff_plus': key_stats['Stuff+'],
-                'era': pitcher['ERA'] if 'ERA' in pitcher.index else 'N/A',
-                'k_rate': pitcher['K%'] if 'K%' in pitcher.index else 'N/A',
-                'bb_rate': pitcher['BB%'] if 'BB%' in pitcher.index else 'N/A',
-                'strengths': '; '.join(strengths[:3]) if strengths else 'None identified',
-                'weaknesses': '; '.join(weaknesses[:3]) if weaknesses else 'None identified',
-                'score_breakdown': score_breakdown
-            }
-            
-            results.append(result)
-        
+        n = len(fangraphs_df)
+        logger.info(f"Evaluating {n} pitchers...")
+
+        # Resolve column names once for the whole frame
+        metrics = self._metric_order
+        resolved = self.resolve_columns(fangraphs_df.columns)
+        weights = self._weights
+
+        # Stack the metric columns into an (n, m) matrix; missing columns
+        # become all-NaN so the weight mask drops them everywhere
+        columns = []
+        for metric in metrics:
+            col_name = resolved[metric]
+            if col_name is not None:
+                columns.append(pd.to_numeric(fangraphs_df[col_name], errors='coerce').to_numpy(dtype=np.float32))
+            else:
+                columns.append(np.full(n, np.nan, dtype=np.float32))
+        vals = np.stack(columns, axis=1)
+        valid = ~np.isnan(vals)
+
+        # Percentile scores, one searchsorted pass per metric
+        scores = np.empty((n, len(metrics)), dtype=np.float32)
+        for j, metric in enumerate(metrics):
+            scores[:, j] = self.score_metric_column(vals[:, j], metric)
+
+        # Weighted composite over the valid metrics only
+        weight_sums = (weights * valid).sum(axis=1)
+        totals = (scores * weights * valid).sum(axis=1)
+        composite = np.divide(totals, weight_sums,
+                              out=np.full(n, 50.0), where=weight_sums > 0)
+        composite = composite.round(1)
+
+        grades = self.get_grade(composite)
+        tiers = self.get_tier(composite)
+
+        # Strengths/weaknesses straight from the score matrix — no per-row
+        # breakdown dicts, which forced an object column into the results
+        strong = (scores >= 80) & valid
+        weak = (scores <= 40) & valid
+        strengths_col = []
+        weaknesses_col = []
+        for i in range(n):
+            strengths = [f"{metrics[j]}: {vals[i, j]}" for j in np.flatnonzero(strong[i])[:3]]
+            weaknesses = [f"{metrics[j]}: {vals[i, j]}" for j in np.flatnonzero(weak[i])[:3]]
+            strengths_col.append('; '.join(strengths) if strengths else 'None identified')
+            weaknesses_col.append('; '.join(weaknesses) if weaknesses else 'None identified')
+
+        def raw_column(col_name, default):
+            if col_name is not None and col_name in fangraphs_df.columns:
+                return fangraphs_df[col_name].to_numpy()
+            return np.full(n, default, dtype=object)
+
+        results_df = pd.DataFrame({
+            'pitcher_name': raw_column('Name', 'Unknown'),
+            'team': raw_column('Team', 'N/A'),
+            'innings_pitched': raw_column('IP', 'N/A'),
+            'composite_score': composite,
+            'grade': grades,
+            'tier': tiers,
+            'whip': raw_column(resolved['WHIP'], 'N/A'),
+            'fip': raw_column(resolved['FIP'], 'N/A'),
+            'siera': raw_column(resolved['SIERA'], 'N/A'),
+            'csw_rate': raw_column(resolved['CSW%'], 'N/A'),
+            'xera': raw_column(resolved['xERA'], 'N/A'),
+            'xfip': raw_column(resolved['xFIP'], 'N/A'),
+            'xwoba': raw_column(resolved['xwOBA'], 'N/A'),
+            'xba': raw_column(resolved['xBA'], 'N/A'),
+            'xslg': raw_column(resolved['xSLG'], 'N/A'),
+            'stuff_plus': raw_column(resolved['Stuff+'], 'N/A'),
+            'era': raw_column('ERA', 'N/A'),
+            'k_rate': raw_column('K%', 'N/A'),
+            'bb_rate': raw_column('BB%', 'N/A'),
+            'strengths': strengths_col,
+            'weaknesses': weaknesses_col
+        })
+
         # Sort by composite score (descending)
-        results_df = pd.DataFrame(results)
         results_df = results_df.sort_values('composite_score', ascending=False)
         results_df['rank'] = range(1, len(results_df) + 1)
-        
+
         return results_df
 
+# Columns the evaluator actually reads (including header alternates),
+# so read_csv can skip the rest of the ~60-column Fangraphs export
+EVALUATOR_COLUMNS = frozenset([
+    'Name', 'Team', 'IP', 'WHIP', 'FIP', 'SIERA', 'CSW%', 'CSW',
+    'xERA', 'xFIP', 'xwOBA', 'xBA', 'xSLG', 'Stuff+', 'Stuff',
+    'ERA', 'K%', 'BB%'
+])
+EVALUATOR_DTYPES = {col: 'float32' for col in EVALUATOR_COLUMNS if col not in ('Name', 'Team')}
+
 def evaluate_fangraphs_pitchers(fangraphs_file: Path):
     """Load Fangraphs data and evaluate pitchers"""
     try:
         logger.info(f"Loading Fangraphs pitcher data from: {fangraphs_file}")
-        fangraphs_df = pd.read_csv(fangraphs_file)
-        
-        logger.info(f"Available columns: {list(fangraphs_df.columns)}")
+        # The pyarrow engine needs a concrete column list, so scan the
+        # header line first and intersect it with the evaluator's columns
+        with open(fangraphs_file) as f:
+            header = f.readline().rstrip('\n').split(',')
+        wanted = [c for c in header if c in EVALUATOR_COLUMNS]
+        dtypes = {c: EVALUATOR_DTYPES[c] for c in wanted if c in EVALUATOR_DTYPES}
+        try:
+            fangraphs_df = pd.read_csv(fangraphs_file, engine='pyarrow',
+                                       usecols=wanted, dtype=dtypes)
+        except (ImportError, ValueError):
+            fangraphs_df = pd.read_csv(fangraphs_file, usecols=wanted, dtype=dtypes)
         
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Available columns: %s", fangraphs_df.columns.tolist())
+
         evaluator = FangraphsPitcherEvaluator()
         results_df = evaluator.evaluate_pitchers(fangraphs_df)
         
@@ -314,16 +361,21 @@ def evaluate_fangraphs_pitchers(fangraphs_file: Path):
 
 def find_latest_fangraphs_file():
     """Find the most recent pitcher data file (enhanced or regular Fangraphs)"""
-    # Look for enhanced data first
-    enhanced_files = list(PROCESSED_DIR.glob("enhanced_pitcher_data_*.csv"))
-    fangraphs_files = list(PROCESSED_DIR.glob("fangraphs_pitcher_data_*.csv"))
-    
-    all_files = enhanced_files + fangraphs_files
-    if not all_files:
+    # os.scandir caches stat info from the directory read — one syscall
+    # per file instead of the glob + stat pair
+    prefixes = ("enhanced_pitcher_data_", "fangraphs_pitcher_data_")
+    try:
+        with os.scandir(PROCESSED_DIR) as entries:
+            candidates = [e for e in entries
+                          if e.name.startswith(prefixes) and e.name.endswith(".csv")]
+    except FileNotFoundError:
+        candidates = []
+
+    if not candidates:
         logger.error("No pitcher data files found.")
         return None
-    
-    latest_file = max(all_files, key=lambda x: x.stat().st_mtime)
+
+    latest_file = Path(max(candidates, key=lambda e: e.stat().st_mtime).path)
     logger.info(f"Using pitcher data file: {latest_file}")
     return latest_file
 
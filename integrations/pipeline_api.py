@@ -7,16 +7,23 @@ Integrates with the dashboard to provide live updates and manual controls.
 """
 
 import os
+import re
 import sys
 import json
 import logging
 import threading
-from datetime import datetime
+from collections import deque
+from datetime import datetime, date as date_type
 from pathlib import Path
 from typing import Dict, Any, Optional
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import time
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -28,18 +35,60 @@ from modeling.prediction_service import MLBPredictionService
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson.
+
+    Serializes every jsonify() response in native code — including
+    datetimes and NumPy scalars from the prediction frames — which
+    matters under constant dashboard polling.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 # Initialize Flask app
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 CORS(app)  # Enable CORS for dashboard integration
 
-# Global pipeline state
+# Global pipeline state. run_history is a bounded ring buffer: appends
+# are O(1) and old entries fall off automatically, so no trim pass is
+# needed and memory stays flat however long the server runs.
 pipeline_state = {
     'current_run': None,
     'last_run': None,
     'is_running': False,
-    'run_history': []
+    'run_history': deque(maxlen=10)
 }
 
+# The background runner thread mutates pipeline_state while Flask worker
+# threads read it; the RLock keeps multi-field updates atomic so status
+# polls can't observe torn state (e.g. is_running True with current_run
+# already None)
+_state_lock = threading.RLock()
+
+# Shape check + fromisoformat is roughly 10x cheaper than the
+# locale-aware strptime the validation used before
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def _valid_date(value: str) -> bool:
+    """Validate a YYYY-MM-DD date string cheaply."""
+    if not _DATE_RE.fullmatch(value):
+        return False
+    try:
+        date_type.fromisoformat(value)
+        return True
+    except ValueError:
+        return False
+
 
 class ThreadedPipelineRunner:
     """Run pipeline in background thread to avoid blocking API."""
@@ -52,13 +101,14 @@ class ThreadedPipelineRunner:
         global pipeline_state
         
         try:
-            pipeline_state['is_running'] = True
-            pipeline_state['current_run'] = {
-                'date': date,
-                'bankroll': bankroll,
-                'started_at': datetime.now().isoformat(),
-                'status': 'running'
-            }
+            with _state_lock:
+                pipeline_state['is_running'] = True
+                pipeline_state['current_run'] = {
+                    'date': date,
+                    'bankroll': bankroll,
+                    'started_at': datetime.now().isoformat(),
+                    'status': 'running'
+                }
             
             logger.info(f"Starting background pipeline for {date}")
             
@@ -69,39 +119,37 @@ class ThreadedPipelineRunner:
             
             # Update pipeline state with results
             status = 'completed' if result['integrated_data'] is not None else 'failed'
-            pipeline_state['current_run']['status'] = status
-            pipeline_state['current_run']['completed_at'] = datetime.now().isoformat()
-            pipeline_state['current_run']['result'] = {
-                'status': status,
-                'files_created': [str(f) for f in result['files_created'] if f],
-                'total_games': len(result['games_data']) if result['games_data'] else 0
-            }
-            
-            # Move to history
-            pipeline_state['last_run'] = pipeline_state['current_run'].copy()
-            pipeline_state['run_history'].append(pipeline_state['current_run'])
-            
-            # Keep only last 10 runs in history
-            if len(pipeline_state['run_history']) > 10:
-                pipeline_state['run_history'] = pipeline_state['run_history'][-10:]
-            
-            pipeline_state['current_run'] = None
-            pipeline_state['is_running'] = False
+            with _state_lock:
+                pipeline_state['current_run']['status'] = status
+                pipeline_state['current_run']['completed_at'] = datetime.now().isoformat()
+                pipeline_state['current_run']['result'] = {
+                    'status': status,
+                    'files_created': [str(f) for f in result['files_created'] if f],
+                    'total_games': len(result['games_data']) if result['games_data'] else 0
+                }
+
+                # Move to history
+                pipeline_state['last_run'] = pipeline_state['current_run'].copy()
+                pipeline_state['run_history'].append(pipeline_state['current_run'])
+
+                pipeline_state['current_run'] = None
+                pipeline_state['is_running'] = False
             
             logger.info(f"Background pipeline completed with status: {status}")
             
         except Exception as e:
             logger.error(f"Background pipeline failed: {e}")
             
-            pipeline_state['current_run']['status'] = 'failed'
-            pipeline_state['current_run']['error'] = str(e)
-            pipeline_state['current_run']['completed_at'] = datetime.now().isoformat()
-            
-            pipeline_state['last_run'] = pipeline_state['current_run'].copy()
-            pipeline_state['run_history'].append(pipeline_state['current_run'])
-            
-            pipeline_state['current_run'] = None
-            pipeline_state['is_running'] = False
+            with _state_lock:
+                pipeline_state['current_run']['status'] = 'failed'
+                pipeline_state['current_run']['error'] = str(e)
+                pipeline_state['current_run']['completed_at'] = datetime.now().isoformat()
+
+                pipeline_state['last_run'] = pipeline_state['current_run'].copy()
+                pipeline_state['run_history'].append(pipeline_state['current_run'])
+
+                pipeline_state['current_run'] = None
+                pipeline_state['is_running'] = False
     
     def get_current_status(self) -> Optional[Dict]:
         """Get status of currently running pipeline."""
@@ -110,18 +158,31 @@ class ThreadedPipelineRunner:
 
 runner = ThreadedPipelineRunner()
 
+# One shared prediction service: constructing it per request re-ran the
+# directory setup and model warm-up on every POST. Construction failures
+# must not kill API import, so fall back to per-request instances then.
+try:
+    prediction_service = MLBPredictionService()
+except Exception as e:
+    logger.warning(f"Could not pre-build prediction service: {e}")
+    prediction_service = None
+# predict_live_games mutates service state (model, feature frames), so
+# serialize access from Flask's worker threads
+_prediction_lock = threading.Lock()
+
 
 @app.route('/api/pipeline/trigger', methods=['POST'])
 def trigger_pipeline():
     """Trigger the daily pipeline."""
     try:
         # Check if pipeline is already running
-        if pipeline_state['is_running']:
-            return jsonify({
-                'success': False,
-                'error': 'Pipeline is already running',
-                'current_run': pipeline_state['current_run']
-            }), 400
+        with _state_lock:
+            if pipeline_state['is_running']:
+                return jsonify({
+                    'success': False,
+                    'error': 'Pipeline is already running',
+                    'current_run': pipeline_state['current_run']
+                }), 400
         
         # Get parameters from request
         data = request.get_json() or {}
@@ -129,9 +190,7 @@ def trigger_pipeline():
         bankroll = data.get('bankroll', 1000.0)
         
         # Validate parameters
-        try:
-            datetime.strptime(date, '%Y-%m-%d')
-        except ValueError:
+        if not _valid_date(date):
             return jsonify({
                 'success': False,
                 'error': 'Invalid date format. Use YYYY-MM-DD'
@@ -171,17 +230,20 @@ def trigger_pipeline():
 def get_pipeline_status():
     """Get current pipeline status."""
     try:
-        status = {
-            'is_running': pipeline_state['is_running'],
-            'current_run': pipeline_state['current_run'],
-            'last_run': pipeline_state['last_run']
-        }
-        
-        # Add detailed status if pipeline is running
-        if pipeline_state['is_running']:
-            detailed_status = runner.get_current_status()
-            if detailed_status:
-                status['detailed_status'] = detailed_status
+        # Snapshot under the lock so the response reflects one coherent
+        # state, then serialize outside it
+        with _state_lock:
+            status = {
+                'is_running': pipeline_state['is_running'],
+                'current_run': pipeline_state['current_run'],
+                'last_run': pipeline_state['last_run']
+            }
+
+            # Add detailed status if pipeline is running
+            if pipeline_state['is_running']:
+                detailed_status = runner.get_current_status()
+                if detailed_status:
+                    status['detailed_status'] = detailed_status
         
         return jsonify({
             'success': True,
@@ -200,9 +262,11 @@ def get_pipeline_status():
 def get_pipeline_history():
     """Get pipeline run history."""
     try:
+        with _state_lock:
+            history = list(pipeline_state['run_history'])
         return jsonify({
             'success': True,
-            'history': pipeline_state['run_history']
+            'history': history
         })
         
     except Exception as e:
@@ -217,7 +281,9 @@ def get_pipeline_history():
 def stop_pipeline():
     """Stop the currently running pipeline (if possible)."""
     try:
-        if not pipeline_state['is_running']:
+        with _state_lock:
+            is_running = pipeline_state['is_running']
+        if not is_running:
             return jsonify({
                 'success': False,
                 'error': 'No pipeline is currently running'
@@ -275,9 +341,7 @@ def generate_predictions():
         odds = data.get('odds', 1.91)
         
         # Validate parameters
-        try:
-            datetime.strptime(date, '%Y-%m-%d')
-        except ValueError:
+        if not _valid_date(date):
             return jsonify({
                 'success': False,
                 'error': 'Invalid date format. Use YYYY-MM-DD'
@@ -290,16 +354,17 @@ def generate_predictions():
             }), 400
         
         logger.info(f"Generating predictions for {date} with ${bankroll} bankroll")
-        
-        # Initialize prediction service
-        service = MLBPredictionService()
-        
+
+        # Reuse the warm module-level service when it built successfully
+        service = prediction_service or MLBPredictionService()
+
         # Generate predictions
-        result = service.predict_live_games(
-            target_date=date,
-            bankroll=float(bankroll),
-            default_odds=float(odds)
-        )
+        with _prediction_lock:
+            result = service.predict_live_games(
+                target_date=date,
+                bankroll=float(bankroll),
+                default_odds=float(odds)
+            )
         
         if result['success']:
             logger.info(f"Generated {result['summary']['total_games']} predictions, {result['summary']['recommended_bets']} with Kelly edge")
@@ -370,13 +435,21 @@ if __name__ == '__main__':
     
     Integration with Dashboard:
     The dashboard can call these APIs to trigger and monitor the pipeline.
-    
+
     Press Ctrl+C to stop the server
     """)
-    
-    app.run(
-        host='0.0.0.0',
-        port=5001,
-        debug=True,
-        threaded=True
-    )
\ No newline at end of file
+
+    # Serve through waitress when available: a proper threaded WSGI
+    # server without the dev server's per-request overhead or the
+    # debug-mode reloader forking a watcher process. Set
+    # PIPELINE_API_DEBUG=1 to get the old Werkzeug debug behaviour.
+    # (gunicorn users can point at integrations.wsgi:app instead.)
+    debug = os.getenv('PIPELINE_API_DEBUG') == '1'
+    if debug:
+        app.run(host='0.0.0.0', port=5001, debug=True, threaded=True)
+    else:
+        try:
+            from waitress import serve
+            serve(app, host='0.0.0.0', port=5001, threads=8)
+        except ImportError:
+            app.run(host='0.0.0.0', port=5001, debug=False, threaded=True)
\ No newline at end of file
@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for the Pipeline API.
+
+Run behind a production server, e.g.:
+
+    gunicorn -w 4 -k gthread --threads 8 -b 0.0.0.0:5001 integrations.wsgi:app
+    waitress-serve --host 0.0.0.0 --port 5001 integrations.wsgi:app
+"""
+
+from integrations.pipeline_api import app  # noqa: F401
@@ -14,13 +14,58 @@ Where:
 """
 
 import logging
+from functools import lru_cache
 from typing import Union
 import numpy as np
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
 
+def _kelly_kernel(win_probability: float, net_odds: float,
+                  bankroll_cents: float, max_bet_fraction: float) -> float:
+    """Pure arithmetic core of the Kelly sizing, free of validation and
+    logging so numba can compile it. Operates on the bankroll in cents
+    and returns the bet in (unrounded) cents; 0.0 for negative edges."""
+    kelly_fraction = (net_odds * win_probability - (1.0 - win_probability)) / net_odds
+    if kelly_fraction <= 0.0:
+        return 0.0
+    safe_fraction = kelly_fraction if kelly_fraction < max_bet_fraction else max_bet_fraction
+    return bankroll_cents * safe_fraction
+
+
+# Compile the kernel when numba is available — backtests and parameter
+# sweeps call it in tight loops. cache=True persists the compilation
+# across runs; the pure-Python definition serves as the fallback.
+if njit is not None:
+    _kelly_kernel = njit(cache=True, fastmath=True)(_kelly_kernel)
+
+# Quantization step for cache keys: 1e-6 on probabilities/fractions is
+# far finer than the cent rounding at the boundary, and integer keys
+# hash deterministically where raw floats would not
+_QUANT = 1_000_000
+
+
+@lru_cache(maxsize=4096)
+def _kelly_cached(prob_q: int, net_odds_q: int,
+                  bankroll_cents: int, max_fraction_q: int) -> float:
+    """Memoized kernel call on integer-quantized inputs.
+
+    Sweeps and dashboard re-scorings recompute the same
+    (probability, odds, bankroll, fraction) tuples over and over; a hit
+    here is a dict lookup. The bet is quantized to whole cents here, so
+    the dollar value returned is exact. Call
+    ``_kelly_cached.cache_clear()`` to reset between test runs.
+    """
+    bet_cents = int(round(_kelly_kernel(prob_q / _QUANT, net_odds_q / _QUANT,
+                                        float(bankroll_cents), max_fraction_q / _QUANT)))
+    return bet_cents / 100.0
+
+
 def calculate_kelly_bet_size(
     win_probability: float,
     decimal_odds: float, 
@@ -74,41 +119,31 @@ def calculate_kelly_bet_size(
     if not (0.0 < max_bet_fraction <= 1.0):
         raise ValueError(f"max_bet_fraction must be between 0.0 and 1.0, got {max_bet_fraction}")
     
-    try:
-        # Kelly Criterion calculation
-        # f = (bp - q) / b
-        # Where b = decimal_odds - 1 (net odds)
-        net_odds = decimal_odds - 1.0  # Convert decimal odds to net odds
-        lose_probability = 1.0 - win_probability
-        
-        # Kelly fraction
-        kelly_fraction = (net_odds * win_probability - lose_probability) / net_odds
-        
-        # Safety checks
-        if kelly_fraction <= 0.0:
-            # Negative expected value - don't bet
-            logger.debug(f"Negative Kelly fraction: {kelly_fraction:.4f} - no bet recommended")
-            return 0.0
-        
-        # Apply fractional Kelly for risk management
-        safe_kelly_fraction = min(kelly_fraction, max_bet_fraction)
-        
-        # Calculate bet amount
-        bet_amount = bankroll * safe_kelly_fraction
-        
-        # Final safety bounds check
-        bet_amount = max(0.0, min(bet_amount, bankroll * max_bet_fraction))
-        
-        logger.debug(f"Kelly calculation: prob={win_probability:.3f}, odds={decimal_odds:.2f}, "
-                    f"kelly_fraction={kelly_fraction:.4f}, safe_fraction={safe_kelly_fraction:.4f}, "
-                    f"bet_amount=${bet_amount:.2f}")
-        
-        return round(bet_amount, 2)
-        
-    except (ZeroDivisionError, OverflowError, ValueError) as e:
-        logger.error(f"Kelly calculation error: {e}")
+    # Kelly Criterion calculation: f = (bp - q) / b where
+    # b = decimal_odds - 1 (net odds). The arithmetic lives in the
+    # compiled kernel; this wrapper keeps validation and logging. The
+    # preconditions above guarantee net_odds > 0 and finite floats, so
+    # no exception handler is needed around the arithmetic.
+    bet_amount = _kelly_cached(
+        int(round(win_probability * _QUANT)),
+        int(round((decimal_odds - 1.0) * _QUANT)),
+        int(round(bankroll * 100)),
+        int(round(max_bet_fraction * _QUANT)),
+    )
+
+    if bet_amount <= 0.0:
+        # Negative expected value - don't bet
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Negative Kelly fraction for prob=%.3f - no bet recommended",
+                         win_probability)
         return 0.0
 
+    logger.debug("Kelly calculation: prob=%.3f, odds=%.2f, bet_amount=$%.2f",
+                 win_probability, decimal_odds, bet_amount)
+
+    # Already quantized to whole cents in the cached layer
+    return bet_amount
+
 
 def calculate_kelly_for_predictions(
     predictions_df,
@@ -132,43 +167,52 @@ def calculate_kelly_for_predictions(
     if predictions_df.empty:
         logger.warning("No predictions provided for Kelly sizing")
         return {}
-    
+
+    # Vectorize the per-game arithmetic: pull the columns out as arrays
+    # once instead of boxing every row into a Series via iterrows
+    p = predictions_df['Win Probability'].to_numpy(dtype=np.float64)
+    home = predictions_df['Home Team'].to_numpy()
+    away = predictions_df['Away Team'].to_numpy()
+
+    # Bet on whichever side is favored: home at p, away at 1 - p
+    bet_prob = np.where(p > 0.5, p, 1.0 - p)
+    teams = np.where(p > 0.5, home, away)
+
+    # Kelly fraction f = (bp - q) / b for every game at once, capped by
+    # the fractional-Kelly safety limit
+    net_odds = default_odds - 1.0
+    kelly = (net_odds * bet_prob - (1.0 - bet_prob)) / net_odds
+    frac = np.minimum(kelly, max_bet_fraction)
+
+    # Only consider bets with reasonable edge (minimum 53% confidence)
+    # and positive expected value
+    candidates = np.nonzero((bet_prob > 0.53) & (frac > 0.0))[0]
+
     recommendations = []
-    total_recommended_bets = 0.0
-    
-    for idx, row in predictions_df.iterrows():
-        win_prob = row.get('Win Probability', 0.0)
-        home_team = row.get('Home Team', 'Unknown')
-        away_team = row.get('Away Team', 'Unknown')
-        
-        # Determine which team to bet on
-        if win_prob > 0.5:
-            # Bet on home team
-            team_to_bet = home_team
-            bet_probability = win_prob
-        else:
-            # Bet on away team  
-            team_to_bet = away_team
-            bet_probability = 1.0 - win_prob
-        
-        # Only consider bets with reasonable edge
-        if bet_probability > 0.53:  # Minimum 53% confidence
-            bet_size = calculate_kelly_bet_size(
-                win_probability=bet_probability,
-                decimal_odds=default_odds,
-                bankroll=bankroll - total_recommended_bets,  # Account for other bets
-                max_bet_fraction=max_bet_fraction
-            )
-            
-            if bet_size > 0:
-                recommendations.append({
-                    'matchup': f"{away_team} @ {home_team}",
-                    'team_to_bet': team_to_bet,
-                    'win_probability': bet_probability,
-                    'bet_size': bet_size,
-                    'expected_value': bet_size * (bet_probability * (default_odds - 1) - (1 - bet_probability))
-                })
-                total_recommended_bets += bet_size
+    # Each bet drains the bankroll available to the next, so the final
+    # sizing is a short sequential pass over just the qualifying rows.
+    # Track the bankroll in integer cents: summing exact cents avoids
+    # the float drift that accumulated across a slate of round(., 2)s.
+    bankroll_cents = int(round(bankroll * 100))
+    total_cents = 0
+
+    for i in candidates:
+        bet_cents = int(round((bankroll_cents - total_cents) * frac[i]))
+
+        if bet_cents > 0:
+            bet_size = bet_cents / 100.0
+            bet_probability = float(bet_prob[i])
+            recommendations.append({
+                'row_idx': predictions_df.index[i],
+                'matchup': f"{away[i]} @ {home[i]}",
+                'team_to_bet': teams[i],
+                'win_probability': bet_probability,
+                'bet_size': bet_size,
+                'expected_value': bet_size * (bet_probability * net_odds - (1 - bet_probability))
+            })
+            total_cents += bet_cents
+
+    total_recommended_bets = total_cents / 100.0
     
     return {
         'recommendations': recommendations,
@@ -116,6 +116,9 @@ def predict_today_matchups(model, feature_columns, team_feature_path, matchup_pa
         today_str = datetime.today().strftime('%Y-%m-%d')
         output_path = output_dir / f"readable_win_predictions_for_{today_str}.csv"
         output.to_csv(output_path, index=False)
+        # Pointer file lets consumers find the newest predictions without
+        # glob+stat scans over the whole processed directory
+        (output_dir / '.latest_predictions').write_text(output_path.name)
         logger.info(f"Saved real-time predictions to: {output_path}")
     except Exception as e:
         logger.error(f"Failed during output formatting/saving: {e}")
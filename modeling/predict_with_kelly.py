@@ -7,6 +7,12 @@ with the existing ML prediction models.
 """
 
 import pandas as pd
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    from pyarrow import feather
+except ImportError:
+    pa = None
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -54,11 +60,12 @@ def predict_with_kelly_sizing(
             logger.warning("No predictions found in file")
             return None
             
-        # Validate required columns
-        required_cols = ['Win Probability', 'Home Team', 'Away Team']
-        missing_cols = [col for col in required_cols if col not in predictions_df.columns]
-        if missing_cols:
-            logger.error(f"Missing required columns: {missing_cols}")
+        # Validate required columns (set superset check; the column
+        # Index is only scanned on the failure path)
+        required_cols = ('Win Probability', 'Home Team', 'Away Team')
+        cols = set(predictions_df.columns)
+        if not cols.issuperset(required_cols):
+            logger.error(f"Missing required columns: {[c for c in required_cols if c not in cols]}")
             return None
             
         logger.info(f"Loaded {len(predictions_df)} predictions")
@@ -71,28 +78,27 @@ def predict_with_kelly_sizing(
             max_bet_fraction=max_bet_fraction
         )
         
-        # Create enhanced output DataFrame
-        enhanced_df = predictions_df.copy()
-        
-        # Add Kelly sizing columns
-        enhanced_df['Bet_Size'] = 0.0
-        enhanced_df['Team_To_Bet'] = ''
-        enhanced_df['Expected_Value'] = 0.0
-        enhanced_df['Kelly_Edge'] = False
-        
-        # Populate bet sizing information
-        for rec in kelly_results['recommendations']:
-            # Find matching row
-            mask = (
-                (enhanced_df['Home Team'].str.contains(rec['matchup'].split(' @ ')[1], na=False)) &
-                (enhanced_df['Away Team'].str.contains(rec['matchup'].split(' @ ')[0], na=False))
-            )
-            
-            if mask.any():
-                enhanced_df.loc[mask, 'Bet_Size'] = rec['bet_size']
-                enhanced_df.loc[mask, 'Team_To_Bet'] = rec['team_to_bet']
-                enhanced_df.loc[mask, 'Expected_Value'] = rec['expected_value']
-                enhanced_df.loc[mask, 'Kelly_Edge'] = True
+        # Add Kelly sizing columns directly on the loaded frame — it is
+        # not used again afterwards, so the old deep copy only doubled
+        # peak memory. Pre-allocated typed arrays keep the new columns
+        # at float32/bool width instead of defaulting to float64.
+        n = len(predictions_df)
+        predictions_df['Bet_Size'] = np.zeros(n, dtype=np.float32)
+        predictions_df['Team_To_Bet'] = np.full(n, '', dtype=object)
+        predictions_df['Expected_Value'] = np.zeros(n, dtype=np.float32)
+        predictions_df['Kelly_Edge'] = np.zeros(n, dtype=bool)
+        enhanced_df = predictions_df
+        
+        # Populate bet sizing information. Each recommendation carries
+        # the index of its originating row, so this is one indexed
+        # assignment per column instead of a substring scan per bet.
+        recs = kelly_results['recommendations']
+        if recs:
+            idxs = [rec['row_idx'] for rec in recs]
+            enhanced_df.loc[idxs, 'Bet_Size'] = [rec['bet_size'] for rec in recs]
+            enhanced_df.loc[idxs, 'Team_To_Bet'] = [rec['team_to_bet'] for rec in recs]
+            enhanced_df.loc[idxs, 'Expected_Value'] = [rec['expected_value'] for rec in recs]
+            enhanced_df.loc[idxs, 'Kelly_Edge'] = True
         
         # Add summary information
         enhanced_df['Odds_Used'] = default_odds
@@ -107,15 +113,22 @@ def predict_with_kelly_sizing(
         output_filename = f"kelly_predictions_{timestamp}.csv"
         output_path = output_dir / output_filename
         
-        # Save enhanced predictions
-        enhanced_df.to_csv(output_path, index=False)
-        
+        # Save enhanced predictions. Arrow's C++ CSV writer skips the
+        # pandas Python-level serializer; the IPC twin memory-maps on
+        # read, so summary consumers can scan Kelly_Edge/Bet_Size without
+        # re-parsing the CSV.
+        if pa is not None:
+            table = pa.Table.from_pandas(enhanced_df, preserve_index=False)
+            pacsv.write_csv(table, output_path)
+            feather.write_feather(enhanced_df, output_path.with_suffix('.feather'))
+        else:
+            enhanced_df.to_csv(output_path, index=False)
+
         # Generate summary report
         summary = generate_kelly_summary(kelly_results, enhanced_df, bankroll)
         summary_path = output_dir / f"kelly_summary_{timestamp}.txt"
-        
-        with open(summary_path, 'w') as f:
-            f.write(summary)
+
+        summary_path.write_text(summary, encoding='utf-8')
         
         logger.info(f"Enhanced predictions saved to: {output_path}")
         logger.info(f"Summary report saved to: {summary_path}")
@@ -128,6 +141,9 @@ def predict_with_kelly_sizing(
         
         return str(output_path)
         
+    except FileNotFoundError:
+        logger.error(f"Predictions file not found: {predictions_path}")
+        return None
     except Exception as e:
         logger.error(f"Error in Kelly prediction pipeline: {e}")
         return None
@@ -194,12 +210,8 @@ def main():
     parser.add_argument("--min-edge", "-e", type=float, default=0.53, help="Minimum edge threshold (default: 0.53)")
     
     args = parser.parse_args()
-    
-    # Validate arguments
-    if not Path(args.predictions).exists():
-        print(f"❌ Error: Predictions file not found: {args.predictions}")
-        return 1
-    
+
+    # Validate arguments (file existence is handled EAFP by the loader)
     if args.bankroll <= 0:
         print(f"❌ Error: Bankroll must be positive, got: {args.bankroll}")
         return 1
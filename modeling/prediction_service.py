@@ -11,6 +11,7 @@ import logging
 import pickle
 import joblib
 from datetime import datetime, date
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import numpy as np
@@ -44,6 +45,23 @@ except ImportError:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=2)
+def _load_model_cached(model_file: str, mtime_ns: int):
+    """Deserialize a model file, memoized per (path, mtime).
+
+    Keeps the model hot in memory across service instances — the API
+    layer constructs a fresh MLBPredictionService per request, and
+    re-running joblib/pickle deserialization each time costs hundreds of
+    milliseconds. A retrained model gets a new mtime and reloads.
+    """
+    model_file = Path(model_file)
+    if model_file.suffix == '.joblib':
+        return joblib.load(model_file)
+    with open(model_file, 'rb') as f:
+        return pickle.load(f)
+
+
 class MLBPredictionService:
     """Service for generating MLB predictions with Kelly Criterion bet sizing."""
     
@@ -90,20 +108,17 @@ class MLBPredictionService:
                 model_file = max(model_files, key=lambda p: p.stat().st_mtime)
             
             logger.info(f"Loading model from: {model_file}")
+
+            self.model = _load_model_cached(str(model_file), model_file.stat().st_mtime_ns)
             
-            if model_file.suffix == '.joblib':
-                self.model = joblib.load(model_file)
-            else:
-                with open(model_file, 'rb') as f:
-                    self.model = pickle.load(f)
-            
-            # Try to load feature columns
+            # Try to load feature columns (EAFP: one open instead of
+            # stat-then-open)
             feature_file = model_file.parent / f"{model_file.stem}_features.txt"
-            if feature_file.exists():
+            try:
                 with open(feature_file, 'r') as f:
                     self.feature_columns = [line.strip() for line in f.readlines()]
                 logger.info(f"Loaded {len(self.feature_columns)} feature columns")
-            else:
+            except FileNotFoundError:
                 logger.warning("Feature columns file not found, will use all available features")
             
             logger.info("Model loaded successfully")
@@ -232,16 +247,18 @@ class MLBPredictionService:
         try:
             date_str = target_date or datetime.now().strftime('%Y-%m-%d')
             
-            # Try to find team features for target date
+            # Try to find team features for target date; EAFP keeps the
+            # happy path to a single open with no extra stat
             team_file = self.processed_dir / f"team_batter_stats_{date_str}.csv"
-            if not team_file.exists():
+            try:
+                team_df = pd.read_csv(team_file)
+            except FileNotFoundError:
                 # Fall back to latest team features
                 team_file = find_latest_file(self.processed_dir, "team_batter_stats_*.csv")
                 if not team_file:
                     logger.warning("No team features file found")
                     return None
-            
-            team_df = pd.read_csv(team_file)
+                team_df = pd.read_csv(team_file)
             logger.info(f"Loaded team features from: {team_file}")
             return team_df
             
@@ -254,16 +271,18 @@ class MLBPredictionService:
         try:
             date_str = target_date or datetime.now().strftime('%Y-%m-%d')
             
-            # Try to find game features for target date
+            # Try to find game features for target date; EAFP keeps the
+            # happy path to a single open with no extra stat
             game_file = self.processed_dir / f"features_{date_str}.csv"
-            if not game_file.exists():
+            try:
+                game_df = pd.read_csv(game_file)
+            except FileNotFoundError:
                 # Fall back to latest game features
                 game_file = find_latest_file(self.processed_dir, "features_*.csv")
                 if not game_file:
                     logger.warning("No game features file found")
                     return None
-            
-            game_df = pd.read_csv(game_file)
+                game_df = pd.read_csv(game_file)
             logger.info(f"Loaded game features from: {game_file}")
             return game_df
             
@@ -422,13 +441,15 @@ class MLBPredictionService:
             output_path = self.predictions_dir / f"kelly_predictions_{timestamp}.csv"
             kelly_df.to_csv(output_path, index=False)
             
+            # Calculate summary statistics in one vectorized pass over
+            # the two columns instead of scanning the record dicts twice
+            edge = kelly_df['Kelly_Edge'].to_numpy(dtype=bool)
+            recommended_bets = int(edge.sum())
+            total_bet_amount = float(kelly_df['Bet_Size'].to_numpy()[edge].sum())
+
             # Convert to JSON-friendly format
             results = kelly_df.to_dict('records')
             
-            # Calculate summary statistics
-            recommended_bets = len([r for r in results if r['Kelly_Edge']])
-            total_bet_amount = sum(r['Bet_Size'] for r in results if r['Kelly_Edge'])
-            
             return {
                 'success': True,
                 'predictions': results,
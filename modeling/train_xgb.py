@@ -143,6 +143,9 @@ def train_model(historical_path, today_path):
     output_name = f"readable_win_predictions_for_{matchup_date}_using_{statcast_date}.csv"
     output_path = PROCESSED_DIR / output_name
     result_df.to_csv(output_path, index=False)
+    # Pointer file lets consumers find the newest predictions without
+    # glob+stat scans over the whole processed directory
+    (PROCESSED_DIR / '.latest_predictions').write_text(output_name)
 
     logger.info(f"Saved predictions to: {output_path}")
     return result_df
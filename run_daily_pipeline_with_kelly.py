@@ -8,10 +8,14 @@ applies Kelly Criterion bet sizing to generate actionable betting recommendation
 
 import os
 import sys
+import hashlib
+import json
 import logging
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
 from pathlib import Path
-import subprocess
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -19,32 +23,55 @@ logger = logging.getLogger(__name__)
 
 def main():
     """Run the complete daily pipeline with Kelly sizing."""
-    
+
     logger.info("🚀 Starting Enhanced Daily MLB Pipeline with Kelly Criterion")
-    
+
     # Configuration
     BANKROLL = float(os.getenv('MLB_BANKROLL', '1000.0'))  # Default $1000 bankroll
     DEFAULT_ODDS = float(os.getenv('MLB_DEFAULT_ODDS', '1.91'))  # -110 American odds
     MAX_BET_FRACTION = float(os.getenv('MLB_MAX_BET_FRACTION', '0.25'))  # Max 25% per bet
-    
+
+    # Monotonic timer for the overall duration — avoids a second
+    # wall-clock read (and tz lookup) just to compute elapsed time
+    t0 = time.perf_counter()
+
     today_str = datetime.today().strftime('%Y-%m-%d')
     base_dir = Path(__file__).parent
-    
+
+    # Nightly batch job on a possibly shared host: drop scheduling
+    # priority a notch and cap OpenMP/BLAS threads to the core budget so
+    # the numeric libraries don't oversubscribe alongside other cron jobs.
+    # Both must happen before the heavy imports below.
+    os.environ.setdefault('OMP_NUM_THREADS', str(min(os.cpu_count() or 1, 4)))
+    if hasattr(os, 'nice'):
+        try:
+            os.nice(5)
+        except OSError:
+            pass
+
+    # Run both steps in-process instead of spawning fresh interpreters:
+    # this skips interpreter startup and re-importing pandas for each
+    # step. The imports are deferred so --help stays instant.
+    sys.path.append(str(base_dir))
+    sys.path.append(str(base_dir / 'modeling'))
+    from scraping.daily_betting_pipeline import DailyBettingPipeline
+    from modeling.predict_with_kelly import predict_with_kelly_sizing
+
     # Step 1: Run the working daily pipeline
     logger.info("📊 Step 1: Running daily betting pipeline...")
     try:
-        result = subprocess.run([
-            sys.executable, 
-            str(base_dir / 'scraping' / 'daily_betting_pipeline.py')
-        ], capture_output=True, text=True, timeout=300)
-        
-        if result.returncode != 0:
-            logger.error(f"Daily pipeline failed: {result.stderr}")
+        pipeline = DailyBettingPipeline()
+        # The pool preserves the old subprocess timeout semantics
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = executor.submit(pipeline.collect_daily_data, today_str).result(timeout=300)
+
+        if results['integrated_data'] is None:
+            logger.error("Daily pipeline failed to create integrated data")
             return 1
         else:
             logger.info("✅ Daily pipeline completed successfully")
-    
-    except subprocess.TimeoutExpired:
+
+    except FutureTimeoutError:
         logger.error("❌ Daily pipeline timed out (5 minutes)")
         return 1
     except Exception as e:
@@ -55,48 +82,76 @@ def main():
     logger.info("🔍 Step 2: Looking for latest prediction file...")
     
     processed_dir = base_dir / 'data' / 'processed'
-    prediction_files = list(processed_dir.glob(f'readable_win_predictions_for_{today_str}_using_*.csv'))
-    
-    if not prediction_files:
-        # Try alternative naming pattern
-        prediction_files = list(processed_dir.glob(f'readable_win_predictions_for_{today_str}.csv'))
-    
-    if not prediction_files:
-        logger.error(f"❌ No prediction files found for {today_str}")
-        logger.info("Available files:")
-        for file in processed_dir.glob('readable_win_predictions_*.csv'):
-            logger.info(f"  - {file.name}")
-        return 1
-    
-    # Use the most recent file
-    latest_prediction = max(prediction_files, key=lambda p: p.stat().st_mtime)
+
+    # The prediction writers record their output in a pointer file, so
+    # finding "the latest file" is one read instead of a glob+stat scan
+    # over a directory that grows all season. Stale or missing pointers
+    # fall back to the old glob.
+    latest_prediction = None
+    pointer = processed_dir / '.latest_predictions'
+    if pointer.exists():
+        candidate = processed_dir / pointer.read_text().strip()
+        if candidate.exists() and today_str in candidate.name:
+            latest_prediction = candidate
+
+    if latest_prediction is None:
+        prediction_files = list(processed_dir.glob(f'readable_win_predictions_for_{today_str}_using_*.csv'))
+
+        if not prediction_files:
+            # Try alternative naming pattern
+            prediction_files = list(processed_dir.glob(f'readable_win_predictions_for_{today_str}.csv'))
+
+        if not prediction_files:
+            logger.error(f"❌ No prediction files found for {today_str}")
+            logger.info("Available files:")
+            for file in processed_dir.glob('readable_win_predictions_*.csv'):
+                logger.info(f"  - {file.name}")
+            return 1
+
+        # Use the most recent file
+        latest_prediction = max(prediction_files, key=lambda p: p.stat().st_mtime)
     logger.info(f"📁 Found prediction file: {latest_prediction.name}")
     
     # Step 3: Apply Kelly Criterion sizing
     logger.info("💰 Step 3: Applying Kelly Criterion bet sizing...")
     
+    # Kelly sizing is deterministic given the predictions file and the
+    # sizing parameters, so intra-day reruns (after fetch retries or a
+    # dashboard refresh) can reuse the cached result instead of
+    # recomputing. The key also covers the script itself so code changes
+    # invalidate old entries.
+    cache_dir = base_dir / 'data' / 'cache'
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    params = {'bankroll': BANKROLL, 'odds': DEFAULT_ODDS, 'max_fraction': MAX_BET_FRACTION}
+    kelly_script = base_dir / 'modeling' / 'predict_with_kelly.py'
+    digest = hashlib.sha256(latest_prediction.read_bytes() + kelly_script.read_bytes() +
+                            json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+    cached_kelly = cache_dir / f"kelly_{digest}.csv"
+
     try:
-        kelly_result = subprocess.run([
-            sys.executable, 
-            str(base_dir / 'modeling' / 'predict_with_kelly.py'),
-            '--predictions', str(latest_prediction),
-            '--bankroll', str(BANKROLL),
-            '--odds', str(DEFAULT_ODDS),
-            '--max-fraction', str(MAX_BET_FRACTION)
-        ], capture_output=True, text=True, timeout=120)
-        
-        if kelly_result.returncode != 0:
-            logger.error(f"Kelly sizing failed: {kelly_result.stderr}")
+        if cached_kelly.exists():
+            logger.info(f"♻️ Reusing cached Kelly sizing: {cached_kelly.name}")
+            kelly_output = str(cached_kelly)
+        else:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                kelly_output = executor.submit(
+                    predict_with_kelly_sizing,
+                    predictions_path=str(latest_prediction),
+                    bankroll=BANKROLL,
+                    default_odds=DEFAULT_ODDS,
+                    max_bet_fraction=MAX_BET_FRACTION
+                ).result(timeout=120)
+
+        if kelly_output is None:
+            logger.error("Kelly sizing failed")
             return 1
         else:
+            if not cached_kelly.exists():
+                shutil.copy(kelly_output, cached_kelly)
+            # predict_with_kelly_sizing prints the recommendations itself
             logger.info("✅ Kelly sizing completed successfully")
-            # Print Kelly output to console
-            print("\n" + "="*80)
-            print("DAILY MLB BETTING RECOMMENDATIONS")
-            print("="*80)
-            print(kelly_result.stdout)
-    
-    except subprocess.TimeoutExpired:
+
+    except FutureTimeoutError:
         logger.error("❌ Kelly sizing timed out (2 minutes)")
         return 1
     except Exception as e:
@@ -109,7 +164,8 @@ def main():
     logger.info(f"  - Default Odds: {DEFAULT_ODDS} ({-110 if DEFAULT_ODDS == 1.91 else 'custom'})")
     logger.info(f"  - Max Bet Fraction: {MAX_BET_FRACTION:.0%}")
     logger.info(f"  - Date: {today_str}")
-    
+    logger.info(f"  - Duration: {time.perf_counter() - t0:.1f}s")
+
     logger.info("🎉 Enhanced Daily Pipeline completed successfully!")
     
     return 0
@@ -1,6 +1,11 @@
 # daily_betting_pipeline.py
 
 import pandas as pd
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 from datetime import datetime, timedelta
@@ -53,10 +58,12 @@ class DailyBettingPipeline:
     
     def collect_daily_data(self, date_str=None):
         """Collect all daily betting data"""
+        # Read the clock once; the today-check below reuses it
+        today_str = datetime.now().strftime('%Y-%m-%d')
         if date_str is None:
-            date_str = datetime.now().strftime('%Y-%m-%d')
+            date_str = today_str
         
-        logger.info(f"🚀 Starting daily betting pipeline for {date_str}")
+        logger.info("🚀 Starting daily betting pipeline for %s", date_str)
         
         results = {
             'date': date_str,
@@ -68,67 +75,74 @@ class DailyBettingPipeline:
             'files_created': []
         }
         
-        # 1. Collect today's games
-        logger.info("📅 Collecting daily games...")
-        try:
-            if date_str == datetime.now().strftime('%Y-%m-%d'):
-                games_file, games_data = self.games_collector.get_current_games()
-            else:
-                games_data = self.games_collector.get_games_for_date(date_str)
-                games_file = self.games_collector.save_games_data(games_data, date_str)
-            
-            if games_data:
-                results['games_data'] = games_data
-                results['files_created'].append(games_file)
-                logger.info(f"✅ Collected {len(games_data)} games")
-            else:
-                logger.warning("❌ No games data collected")
-        
-        except Exception as e:
-            logger.error(f"❌ Error collecting games: {e}")
-        
-        # 2. Collect odds data
-        logger.info("💰 Collecting odds data...")
-        try:
-            odds_data = self.odds_collector.get_current_odds()
-            if odds_data:
-                odds_file = self.odds_collector.save_odds_data(odds_data)
-                results['odds_data'] = odds_data
-                results['files_created'].append(odds_file)
-                logger.info(f"✅ Collected odds for {len(odds_data)} games")
-            else:
-                logger.warning("❌ No odds data collected")
-        
-        except Exception as e:
-            logger.error(f"❌ Error collecting odds: {e}")
-        
-        # 3. Collect pitcher data (current season)
-        logger.info("⚾ Collecting pitcher data...")
-        try:
-            pitcher_file, pitcher_data = collect_enhanced_pitcher_data(season=2025, min_ip=50)
-            if pitcher_data is not None:
-                results['pitcher_data'] = pitcher_data
-                results['files_created'].append(pitcher_file)
-                logger.info(f"✅ Collected data for {len(pitcher_data)} pitchers")
-            else:
-                logger.warning("❌ No pitcher data collected")
-        
-        except Exception as e:
-            logger.error(f"❌ Error collecting pitcher data: {e}")
-        
-        # 4. Collect hitter data (current season)
-        logger.info("🏏 Collecting hitter data...")
-        try:
-            hitter_file, hitter_data = collect_enhanced_hitter_data(season=2025, min_pa=200)
-            if hitter_data is not None:
-                results['hitter_data'] = hitter_data
-                results['files_created'].append(hitter_file)
-                logger.info(f"✅ Collected data for {len(hitter_data)} hitters")
-            else:
-                logger.warning("❌ No hitter data collected")
-        
-        except Exception as e:
-            logger.error(f"❌ Error collecting hitter data: {e}")
+        def collect_games():
+            if date_str == today_str:
+                return self.games_collector.get_current_games()
+            games_data = self.games_collector.get_games_for_date(date_str)
+            return self.games_collector.save_games_data(games_data, date_str), games_data
+
+        # Steps 1-4 are independent, network-bound fetches against
+        # different hosts, so run them concurrently and gather results in
+        # the original order
+        logger.info("📅 Collecting games, odds, pitcher and hitter data concurrently...")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            games_future = executor.submit(collect_games)
+            odds_future = executor.submit(self.odds_collector.get_current_odds)
+            pitcher_future = executor.submit(collect_enhanced_pitcher_data, season=2025, min_ip=50)
+            hitter_future = executor.submit(collect_enhanced_hitter_data, season=2025, min_pa=200)
+
+            # 1. Collect today's games
+            try:
+                games_file, games_data = games_future.result()
+                if games_data:
+                    results['games_data'] = games_data
+                    results['files_created'].append(games_file)
+                    logger.info("✅ Collected %s games", len(games_data))
+                else:
+                    logger.warning("❌ No games data collected")
+
+            except Exception as e:
+                logger.error("❌ Error collecting games: %s", e)
+
+            # 2. Collect odds data
+            try:
+                odds_data = odds_future.result()
+                if odds_data:
+                    odds_file = self.odds_collector.save_odds_data(odds_data)
+                    results['odds_data'] = odds_data
+                    results['files_created'].append(odds_file)
+                    logger.info("✅ Collected odds for %s games", len(odds_data))
+                else:
+                    logger.warning("❌ No odds data collected")
+
+            except Exception as e:
+                logger.error("❌ Error collecting odds: %s", e)
+
+            # 3. Collect pitcher data (current season)
+            try:
+                pitcher_file, pitcher_data = pitcher_future.result()
+                if pitcher_data is not None:
+                    results['pitcher_data'] = pitcher_data
+                    results['files_created'].append(pitcher_file)
+                    logger.info("✅ Collected data for %s pitchers", len(pitcher_data))
+                else:
+                    logger.warning("❌ No pitcher data collected")
+
+            except Exception as e:
+                logger.error("❌ Error collecting pitcher data: %s", e)
+
+            # 4. Collect hitter data (current season)
+            try:
+                hitter_file, hitter_data = hitter_future.result()
+                if hitter_data is not None:
+                    results['hitter_data'] = hitter_data
+                    results['files_created'].append(hitter_file)
+                    logger.info("✅ Collected data for %s hitters", len(hitter_data))
+                else:
+                    logger.warning("❌ No hitter data collected")
+
+            except Exception as e:
+                logger.error("❌ Error collecting hitter data: %s", e)
         
         # 5. Integrate all data
         logger.info("🔗 Integrating all data sources...")
@@ -138,12 +152,12 @@ class DailyBettingPipeline:
                 integrated_file = self.save_integrated_data(integrated_data, date_str)
                 results['integrated_data'] = integrated_data
                 results['files_created'].append(integrated_file)
-                logger.info(f"✅ Created integrated dataset with {len(integrated_data)} games")
+                logger.info("✅ Created integrated dataset with %s games", len(integrated_data))
             else:
                 logger.warning("❌ No integrated data created")
         
         except Exception as e:
-            logger.error(f"❌ Error integrating data: {e}")
+            logger.error("❌ Error integrating data: %s", e)
         
         return results
     
@@ -188,10 +202,10 @@ class DailyBettingPipeline:
                                'fd_over_odds', 'fd_under_odds', 'fd_home_spread', 'fd_away_spread']:
                         integrated_df.loc[_, col] = None
         
-        # Add pitcher data
+        # Add pitcher data (read-only lookups, no defensive copy needed)
         if pitcher_data is not None:
-            pitcher_df = pitcher_data.copy()
-            
+            pitcher_df = pitcher_data
+
             # Add pitcher stats for away and home pitchers
             for _, game in integrated_df.iterrows():
                 away_pitcher = self.normalize_pitcher_name(game.get('away_pitcher', ''))
@@ -263,24 +277,39 @@ class DailyBettingPipeline:
         return team_stats
     
     def save_integrated_data(self, integrated_data, date_str):
-        """Save integrated data to CSV"""
+        """Save integrated data to Parquet (typed, compressed) plus CSV"""
         filename = f"integrated_betting_data_{date_str}.csv"
         filepath = PROCESSED_DIR / filename
-        
-        integrated_data.to_csv(filepath, index=False)
-        logger.info(f"Saved integrated data to {filepath}")
-        
+
+        if pa is not None:
+            # Columnar handoff for downstream readers: keeps dtypes and
+            # skips text re-parsing; the CSV remains the debug artifact
+            # and the fallback for readers without pyarrow. Both writers
+            # release the GIL in their I/O/compression loops, so the two
+            # writes overlap instead of running back-to-back.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                parquet_future = executor.submit(
+                    integrated_data.to_parquet,
+                    filepath.with_suffix('.parquet'), compression='zstd'
+                )
+                csv_future = executor.submit(integrated_data.to_csv, filepath, index=False)
+                parquet_future.result()
+                csv_future.result()
+        else:
+            integrated_data.to_csv(filepath, index=False)
+        logger.info("Saved integrated data to %s", filepath)
+
         return filepath
     
     def collect_historical_results(self, start_date, end_date):
         """Collect historical game results for model training"""
-        logger.info(f"📊 Collecting historical results from {start_date} to {end_date}")
+        logger.info("📊 Collecting historical results from %s to %s", start_date, end_date)
         
         results = self.results_collector.get_date_range_results(start_date, end_date)
         
         if results:
             filepath = self.results_collector.save_results_data(results)
-            logger.info(f"✅ Collected {len(results)} historical games")
+            logger.info("✅ Collected %s historical games", len(results))
             return filepath, results
         
         return None, []
@@ -7,6 +7,10 @@ import logging
 from pathlib import Path
 import argparse
 import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -403,8 +407,15 @@ class LineupCollector:
         json_filename = f"mlb_lineups_{date_str}.json"
         json_filepath = DATA_DIR / json_filename
         
-        with open(json_filepath, 'w') as f:
-            json.dump(lineups, f, indent=2, default=str)
+        # orjson serializes in native code (datetimes included) and is an
+        # order of magnitude faster than stdlib json on big lineup dumps
+        if orjson is not None:
+            json_filepath.write_bytes(
+                orjson.dumps(lineups, option=orjson.OPT_INDENT_2, default=str)
+            )
+        else:
+            with open(json_filepath, 'w') as f:
+                json.dump(lineups, f, indent=2, default=str)
         
         logger.info(f"Saved lineup data to {json_filepath}")
         
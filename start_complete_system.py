@@ -6,6 +6,7 @@ Starts both the dashboard and pipeline API for a complete MLB prediction system.
 """
 
 import os
+import selectors
 import sys
 import subprocess
 import time
@@ -13,6 +14,33 @@ import webbrowser
 from pathlib import Path
 
 
+BASE_DIR = Path(__file__).parent
+
+# Minimal child environment, built once: the servers only need PATH,
+# HOME (on-disk caches) and a PYTHONPATH rooted at the project so they
+# resolve imports identically regardless of where the launcher ran from.
+# MLB_* overrides pass through for the pipeline trigger endpoints.
+SERVER_ENV = {
+    'PATH': os.environ.get('PATH', ''),
+    'HOME': os.environ.get('HOME', ''),
+    'PYTHONPATH': str(BASE_DIR),
+    **{k: v for k, v in os.environ.items() if k.startswith('MLB_')},
+}
+
+
+def start_server(name, script_path):
+    """Start a server subprocess with its output piped for streaming."""
+    return subprocess.Popen(
+        [sys.executable, str(script_path)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,  # line-buffered so log lines appear as they happen
+        cwd=str(BASE_DIR),
+        env=SERVER_ENV
+    )
+
+
 def main():
     """Start the complete MLB prediction system."""
     
@@ -26,20 +54,14 @@ def main():
     
     # Start Pipeline API (port 5001)
     print("🔌 Starting Pipeline API server...")
-    api_process = subprocess.Popen([
-        sys.executable, 
-        str(base_dir / 'integrations' / 'pipeline_api.py')
-    ])
-    
+    api_process = start_server('api', base_dir / 'integrations' / 'pipeline_api.py')
+
     # Wait a moment for API to start
     time.sleep(3)
-    
+
     # Start Enhanced Dashboard (port 5000)
     print("📊 Starting Enhanced Dashboard server...")
-    dashboard_process = subprocess.Popen([
-        sys.executable,
-        str(base_dir / 'web' / 'enhanced_dashboard_app.py')
-    ])
+    dashboard_process = start_server('dashboard', base_dir / 'web' / 'enhanced_dashboard_app.py')
     
     # Wait for servers to start
     time.sleep(5)
@@ -78,20 +100,28 @@ def main():
         print("\\nSkipping browser open.")
     
     try:
-        # Keep the processes running
+        # Keep the processes running, streaming their output line-by-line
+        # instead of letting it buffer — failures surface immediately
         print("\\n⏳ System is running. Press Ctrl+C to stop all servers.")
+        sel = selectors.DefaultSelector()
+        sel.register(api_process.stdout, selectors.EVENT_READ, 'api')
+        sel.register(dashboard_process.stdout, selectors.EVENT_READ, 'dashboard')
+
         while True:
-            time.sleep(1)
-            
+            for key, _ in sel.select(timeout=1):
+                line = key.fileobj.readline()
+                if line:
+                    print(f"[{key.data}] {line.rstrip()}")
+
             # Check if processes are still running
             if api_process.poll() is not None:
                 print("⚠️  Pipeline API has stopped unexpectedly")
                 break
-                
+
             if dashboard_process.poll() is not None:
                 print("⚠️  Dashboard has stopped unexpectedly")
                 break
-                
+
     except KeyboardInterrupt:
         print("\\n\\n🛑 Stopping all servers...")
         
@@ -18,16 +18,25 @@ def main():
     This will start the Flask web server and open your browser.
     """)
     
-    # Change to web directory for enhanced dashboard
-    dashboard_dir = Path(__file__).parent / 'web'
-    os.chdir(dashboard_dir)
-    
-    print(f"📁 Working directory: {dashboard_dir}")
+    base_dir = Path(__file__).parent
+    dashboard_script = base_dir / 'web' / 'enhanced_dashboard_app.py'
+
+    print(f"📁 Working directory: {base_dir}")
     print("🚀 Starting Enhanced Flask server...")
-    
+
+    # Minimal child env + project-root cwd: no chdir side effect in the
+    # launcher, and the server resolves imports/caches the same way as
+    # every other entry point
+    env = {
+        'PATH': os.environ.get('PATH', ''),
+        'HOME': os.environ.get('HOME', ''),
+        'PYTHONPATH': str(base_dir),
+    }
+
     try:
         # Start the Enhanced Flask server
-        subprocess.Popen([sys.executable, 'enhanced_dashboard_app.py'])
+        subprocess.Popen([sys.executable, str(dashboard_script)],
+                         cwd=str(base_dir), env=env)
         
         print("✅ Dashboard server started successfully!")
         print(f"📊 Dashboard URL: http://localhost:5000")
@@ -29,6 +29,17 @@ from mlb_database import MLBDatabase
 PROCESSED_DIR = BASE_DIR / "data" / "processed"
 RAW_DIR = BASE_DIR / "data" / "raw"
 
+def read_integrated_file(csv_path):
+    """Read an integrated data file, preferring its Parquet twin
+
+    The daily pipeline writes both; the Parquet copy keeps dtypes and
+    loads without text parsing.
+    """
+    parquet_path = csv_path.with_suffix('.parquet')
+    if parquet_path.exists():
+        return pd.read_parquet(parquet_path)
+    return pd.read_csv(csv_path)
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'mlb-enhanced-dashboard-2025'
 
@@ -61,7 +72,7 @@ class EnhancedMLBDashboard:
             
             # Try to load today's data first
             if today_file.exists():
-                self.integrated_data = pd.read_csv(today_file)
+                self.integrated_data = read_integrated_file(today_file)
                 self.current_date = datetime.now().strftime("%B %d, %Y")
                 print(f"✅ Loaded today's data: {today_str}")
             else:
@@ -78,7 +89,7 @@ class EnhancedMLBDashboard:
                     integrated_files = list(PROCESSED_DIR.glob("integrated_betting_data_*.csv"))
                     if integrated_files:
                         latest_integrated = max(integrated_files, key=lambda x: x.stat().st_mtime)
-                        self.integrated_data = pd.read_csv(latest_integrated)
+                        self.integrated_data = read_integrated_file(latest_integrated)
                         
                         # Parse date from filename
                         date_str = latest_integrated.name.replace("integrated_betting_data_", "").replace(".csv", "")